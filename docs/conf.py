@@ -14,8 +14,6 @@
 
 import os
 import sys
-import sphinx
-from pprint import pprint
 
 # If extensions (or modules to document with autodoc) are in another directory,
 # add these directories to sys.path here. If the directory is relative to the
@@ -26,8 +24,6 @@ PACKAGE_PATH = os.path.abspath(CUR_PATH + '/../glom/')
 sys.path.insert(0, PROJECT_PATH)
 sys.path.insert(0, PACKAGE_PATH)
 
-pprint(os.environ)
-
 
 # -- Project information -----------------------------------------------------
 
@@ -53,8 +49,7 @@ todo_add_to_theme_to_keep_menus_expanded = """
 # -- General configuration ---------------------------------------------------
 
 # If your documentation needs a minimal Sphinx version, state it here.
-#
-# needs_sphinx = '1.0'
+needs_sphinx = '1.3'  # first release with sphinx.ext.napoleon built in
 
 # Add any Sphinx extension module names here, as strings. They can be
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
@@ -64,14 +59,9 @@ extensions = [
     'sphinx.ext.intersphinx',
     'sphinx.ext.ifconfig',
     'sphinx.ext.viewcode',
+    'sphinx.ext.napoleon',
 ]
 
-# Read the Docs is version 1.2 as of writing
-if sphinx.version_info[:2] < (1, 3):
-    extensions.append('sphinxcontrib.napoleon')
-else:
-    extensions.append('sphinx.ext.napoleon')
-
 
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['_templates']
@@ -606,7 +606,14 @@ class Path:
     To build a Path object from a string, use :meth:`Path.from_text()`. 
     This is the default behavior when the top-level :func:`~glom.glom` 
     function gets a string spec.
+
+    Equal Paths hash equally, so Paths can be used as dict keys and
+    set members. A Path compares equal to a :data:`~glom.T` with the
+    same operations, but T hashes by identity, so don't mix Path and
+    T keys in the same dict or set.
     """
+    __slots__ = ('path_t', '__weakref__')
+
     def __init__(self, *path_parts):
         if not path_parts:
             self.path_t = T
@@ -662,11 +669,12 @@ class Path:
             return cls(*segs)
 
         cache = cls._CACHE[PATH_STAR]  # remove this when PATH_STAR is default
-        if text not in cache:
-            if len(cache) > cls._MAX_CACHE:
-                return create()
-            cache[text] = create()
-        return cache[text]
+        ret = cache.get(text)
+        if ret is None:
+            ret = create()
+            if len(cache) <= cls._MAX_CACHE:
+                cache[text] = ret
+        return ret
 
     def glomit(self, target, scope):
         # The entrypoint for the Path extension
@@ -685,6 +693,25 @@ class Path:
     def __ne__(self, other):
         return not self == other
 
+    def __getstate__(self):
+        # slots without __getstate__ can't pickle under protocols 0 and
+        # 1. keep the dict shape of pre-slots pickles, plus any subclass
+        # attributes
+        state = dict(getattr(self, '__dict__', ()))
+        state['path_t'] = self.path_t
+        return state
+
+    def __setstate__(self, state):
+        if not isinstance(state, dict):  # (path_t,) from unreleased builds
+            state = {'path_t': state[0]}
+        for name, val in state.items():
+            setattr(self, name, val)
+
+    def __hash__(self):
+        # agrees with Path == Path, but not with Path == T, since T
+        # hashes by identity. raises TypeError for unhashable segments
+        return hash(self.path_t.__ops__)
+
     def values(self):
         """
         Returns a tuple of values referenced in this path.
@@ -727,7 +754,7 @@ class Path:
 
     def __getitem__(self, i):
         cur_t_path = self.path_t.__ops__
-        try:
+        if type(i) is slice:  # slice can't be subclassed
             step = i.step
             start = i.start if i.start is not None else 0
             stop = i.stop
@@ -735,7 +762,7 @@ class Path:
             start = (start * 2) + 1 if start >= 0 else (start * 2) + len(cur_t_path)
             if stop is not None:
                 stop = (stop * 2) + 1 if stop >= 0 else (stop * 2) + len(cur_t_path)
-        except AttributeError:
+        else:
             step = 1
             start = (i * 2) + 1 if i >= 0 else (i * 2) + len(cur_t_path)
             if start < 0 or start > len(cur_t_path):
@@ -823,6 +850,10 @@ class Spec:
         return f'{cn}({bbrepr(self.spec)})'
 
 
+def _never_skip(val):
+    return False
+
+
 class Coalesce:
     """Coalesce objects specify fallback behavior for a list of
     subspecs.
@@ -905,11 +936,11 @@ class Coalesce:
             raise ValueError('expected one of "default" or "default_factory", not both')
         self.skip = kwargs.pop('skip', _MISSING)
         if self.skip is _MISSING:
-            self.skip_func = lambda v: False
+            self.skip_func = _never_skip
         elif callable(self.skip):
             self.skip_func = self.skip
         elif isinstance(self.skip, tuple):
-            self.skip_func = lambda v: v in self.skip
+            self.skip_func = self.skip.__contains__  # C-level, no lambda frame
         else:
             self.skip_func = lambda v: v == self.skip
         self.skip_exc = kwargs.pop('skip_exc', GlomError)
@@ -918,10 +949,14 @@ class Coalesce:
 
     def glomit(self, target, scope):
         skipped = []
+        skip_func = self.skip_func
+        if skip_func is _never_skip:
+            skip_func = None  # no skip option, take the first result as-is
+        glom_ = scope[glom]
         for subspec in self.subspecs:
             try:
-                ret = scope[glom](target, subspec, scope)
-                if not self.skip_func(ret):
+                ret = glom_(target, subspec, scope)
+                if skip_func is None or not skip_func(ret):
                     break
                 skipped.append(ret)
             except self.skip_exc as e:
@@ -1092,7 +1127,13 @@ class Call:
     def glomit(self, target, scope):
         'run against the current target'
         r = lambda spec: arg_val(target, spec, scope)
-        return r(self.func)(*r(self.args), **r(self.kwargs))
+        args, kwargs = self.args, self.kwargs
+        # literal-only args evaluate to themselves, skip the recursion
+        if not (type(args) is tuple and all(type(a) in _PLAIN_ARG_TYPES for a in args)):
+            args = r(args)
+        if not (type(kwargs) is dict and all(type(v) in _PLAIN_ARG_TYPES for v in kwargs.values())):
+            kwargs = r(kwargs)
+        return r(self.func)(*args, **kwargs)
 
     def __repr__(self):
         cn = self.__class__.__name__
@@ -1535,6 +1576,11 @@ def _s_first_magic(scope, key, _t):
     return cur
 
 
+# T/Path args of these types always evaluate to themselves, so _t_eval
+# can skip the (child-scope creating) arg_val() call for them
+_PLAIN_ARG_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
 def _t_eval(target, _t, scope):
     t_path = _t.__ops__
     i = 1
@@ -1562,9 +1608,12 @@ def _t_eval(target, _t, scope):
     else:
         raise ValueError('TType instance with invalid root')  # pragma: no cover
     pae = None
+    registry = None  # looked up lazily, at most once per evaluation
+    get_type = get = None  # last 'get' handler, reused while the type holds
     while i < fetch_till:
         op, arg = t_path[i], t_path[i + 1]
-        arg = arg_val(target, arg, scope)
+        if type(arg) not in _PLAIN_ARG_TYPES:
+            arg = arg_val(target, arg, scope)
         if op == '.':
             try:
                 cur = getattr(cur, arg)
@@ -1577,14 +1626,22 @@ def _t_eval(target, _t, scope):
                 pae = PathAccessError(e, Path(_t), i // 2)
         elif op == 'P':
             # Path type stuff (fuzzy match)
-            get = scope[TargetRegistry].get_handler('get', cur, path=t_path[2:i+2:2])
+            if type(cur) is not get_type:
+                if registry is None:
+                    registry = scope[TargetRegistry]
+                get = registry.get_handler('get', cur, raise_exc=False)
+                if get is False:  # only build the error path when it's needed
+                    registry.get_handler('get', cur, path=t_path[2:i+2:2])
+                get_type = type(cur)
             try:
                 cur = get(cur, arg)
             except Exception as e:
                 pae = PathAccessError(e, Path(_t), i // 2)
         elif op in 'xX':
             nxt = []
-            get_handler = scope[TargetRegistry].get_handler
+            if registry is None:
+                registry = scope[TargetRegistry]
+            get_handler = registry.get_handler
             if op == 'x':  # increases arity of cur each time through
                 # TODO: so many try/except -- could scope[TargetRegistry] stuff be cached on type?
                 _extend_children(nxt, cur, get_handler)
@@ -1608,7 +1665,8 @@ def _t_eval(target, _t, scope):
             break  # we handled the rest in recursive call, break loop
         elif op == '(':
             args, kwargs = arg
-            scope[Path] += t_path[2:i+2:2]
+            # rebind rather than +=, the list may belong to a parent scope
+            scope[Path] = scope[Path] + list(t_path[2:i+2:2])
             cur = scope[glom](
                 target, Call(cur, args, kwargs), scope)
             # call with target rather than cur,
@@ -1780,9 +1838,22 @@ class Val:
        compatibility, but reprs have changed.
 
     """
+    __slots__ = ('value', '__weakref__')
+
     def __init__(self, value):
         self.value = value
 
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', ()))  # same as Path
+        state['value'] = self.value
+        return state
+
+    def __setstate__(self, state):
+        if not isinstance(state, dict):
+            state = {'value': state[0]}
+        for name, val in state.items():
+            setattr(self, name, val)
+
     def glomit(self, target, scope):
         return self.value
 
@@ -1912,20 +1983,27 @@ class _ObjStyleKeys(_ObjStyleKeysMeta('_AbstractKeys', (object,), {})):
 
 
 def _get_sequence_item(target, index):
-    return target[int(index)]
+    # string parts from 'a.0.b'-style specs need converting, but ints
+    # from Path()/T don't, so skip the int() call for them
+    if type(index) is not int:
+        index = int(index)
+    return target[index]
 
 
 # handlers are 3-arg callables, with args (spec, target, scope)
 # spec is the first argument for convenience in the case
 # that the handler is a method of the spec type
 def _handle_dict(target, spec, scope):
-    ret = type(spec)()  # TODO: works for dict + ordereddict, but sufficient for all?
+    spec_type = type(spec)
+    # TODO: type(spec)() works for dict + ordereddict, but sufficient for all?
+    ret = {} if spec_type is dict else spec_type()
+    glom_ = scope[glom]  # same for every field, skip the ChainMap walk
     for field, subspec in spec.items():
-        val = scope[glom](target, subspec, scope)
+        val = glom_(target, subspec, scope)
         if val is SKIP:
             continue
         if type(field) in (Spec, TType):
-            field = scope[glom](target, field, scope)
+            field = glom_(target, field, scope)
         ret[field] = val
     return ret
 
@@ -1933,16 +2011,20 @@ def _handle_dict(target, spec, scope):
 def _handle_list(target, spec, scope):
     subspec = spec[0]
     iterate = scope[TargetRegistry].get_handler('iterate', target, path=scope[Path])
-    try:
-        iterator = iterate(target)
-    except Exception as e:
-        raise TypeError('failed to iterate on instance of type %r at %r (got %r)'
-                        % (target.__class__.__name__, Path(*scope[Path]), e))
+    if iterate is iter and type(target) in (list, tuple):
+        iterator = target  # default handler on a plain sequence, iterate it directly
+    else:
+        try:
+            iterator = iterate(target)
+        except Exception as e:
+            raise TypeError('failed to iterate on instance of type %r at %r (got %r)'
+                            % (target.__class__.__name__, Path(*scope[Path]), e))
     ret = []
     base_path = scope[Path]
+    glom_ = scope[glom]
     for i, t in enumerate(iterator):
         scope[Path] = base_path + [i]
-        val = scope[glom](t, subspec, scope)
+        val = glom_(t, subspec, scope)
         if val is SKIP:
             continue
         if val is STOP:
@@ -1962,7 +2044,11 @@ def _handle_tuple(target, spec, scope):
             break
         res = nxt
         if not isinstance(subspec, list):
-            scope[Path] += [getattr(subspec, '__name__', subspec)]
+            if type(subspec) in (str, dict, tuple, TType):
+                seg = subspec  # common specs without a __name__, skip the failed lookup
+            else:
+                seg = getattr(subspec, '__name__', subspec)
+            scope[Path] = scope[Path] + [seg]
     return res
 
 
@@ -1996,7 +2082,7 @@ class TargetRegistry:
         self._op_type_tree = {}  # see _register_fuzzy_type for details
         self._type_cache = {}
 
-        self._op_auto_map = OrderedDict()  # op name to function that returns handler function
+        self._op_auto_map = {}  # op name to function that returns handler function
 
         self._register_builtin_ops()
 
@@ -2011,10 +2097,12 @@ class TargetRegistry:
         raise_exc=False)
 
         """
-        ret = False
         obj_type = type(obj)
         cache_key = (obj_type, op)
-        if cache_key not in self._type_cache:
+        try:
+            ret = self._type_cache[cache_key]
+        except KeyError:
+            ret = False
             type_map = self.get_type_map(op)
             if type_map:
                 try:
@@ -2022,31 +2110,31 @@ class TargetRegistry:
                 except KeyError:
                     type_tree = self._op_type_tree.get(op, {})
                     closest = self._get_closest_type(obj, type_tree=type_tree)
-                    if closest is None:
-                        ret = False
-                    else:
+                    if closest is not None:
                         ret = type_map[closest]
-
-            if ret is False and raise_exc:
-                raise UnregisteredTarget(op, obj_type, type_map=type_map, path=path)
-
             self._type_cache[cache_key] = ret
-        return self._type_cache[cache_key]
+
+        if ret is False and raise_exc:
+            raise UnregisteredTarget(op, obj_type, type_map=self.get_type_map(op), path=path)
+        return ret
 
     def get_type_map(self, op):
         try:
             return self._op_type_map[op]
         except KeyError:
-            return OrderedDict()
+            return {}
 
     def _get_closest_type(self, obj, type_tree):
-        default = None
-        for cur_type, sub_tree in type_tree.items():
-            if isinstance(obj, cur_type):
-                sub_type = self._get_closest_type(obj, type_tree=sub_tree)
-                ret = cur_type if sub_type is None else sub_type
-                return ret
-        return default
+        # walk down the first matching branch at each level, no recursion
+        closest = None
+        while type_tree:
+            for cur_type, sub_tree in type_tree.items():
+                if isinstance(obj, cur_type):
+                    closest, type_tree = cur_type, sub_tree
+                    break
+            else:
+                break
+        return closest
 
     def _register_default_types(self):
         self.register(object)
@@ -2060,7 +2148,7 @@ class TargetRegistry:
         self.register(_ObjStyleKeys, keys=_ObjStyleKeys.get_keys)
 
     def _register_fuzzy_type(self, op, new_type, _type_tree=None):
-        """Build a "type tree", an OrderedDict mapping registered types to
+        """Build a "type tree", a dict mapping registered types to
         their subtypes
 
         The type tree's invariant is that a key in the mapping is a
@@ -2073,22 +2161,27 @@ class TargetRegistry:
             try:
                 _type_tree = self._op_type_tree[op]
             except KeyError:
-                _type_tree = self._op_type_tree[op] = OrderedDict()
-
-        registered = False
-        for cur_type, sub_tree in list(_type_tree.items()):
-            if issubclass(cur_type, new_type):
-                sub_tree = _type_tree.pop(cur_type)  # mutation for recursion brevity
-                try:
-                    _type_tree[new_type][cur_type] = sub_tree
-                except KeyError:
-                    _type_tree[new_type] = OrderedDict({cur_type: sub_tree})
-                registered = True
-            elif issubclass(new_type, cur_type):
-                _type_tree[cur_type] = self._register_fuzzy_type(op, new_type, _type_tree=sub_tree)
-                registered = True
-        if not registered:
-            _type_tree[new_type] = OrderedDict()
+                _type_tree = self._op_type_tree[op] = {}
+
+        # subtrees are disjoint, so an explicit stack visits them the
+        # same as recursion would, without the extra frames
+        stack = [_type_tree]
+        while stack:
+            cur_tree = stack.pop()
+            registered = False
+            for cur_type, sub_tree in list(cur_tree.items()):
+                if issubclass(cur_type, new_type):
+                    sub_tree = cur_tree.pop(cur_type)
+                    try:
+                        cur_tree[new_type][cur_type] = sub_tree
+                    except KeyError:
+                        cur_tree[new_type] = {cur_type: sub_tree}
+                    registered = True
+                elif issubclass(new_type, cur_type):
+                    stack.append(sub_tree)  # updated in place
+                    registered = True
+            if not registered:
+                cur_tree[new_type] = {}
         return _type_tree
 
     def register(self, target_type, **kwargs):
@@ -2098,7 +2191,7 @@ class TargetRegistry:
         new_op_map = dict(kwargs)
 
         for op_name in sorted(set(self._op_auto_map.keys()) | set(new_op_map.keys())):
-            cur_type_map = self._op_type_map.setdefault(op_name, OrderedDict())
+            cur_type_map = self._op_type_map.setdefault(op_name, {})
 
             if op_name in new_op_map:
                 handler = new_op_map[op_name]
@@ -2148,8 +2241,8 @@ class TargetRegistry:
         # determine support for any previously known types
         known_types = set(sum([list(m.keys()) for m
                                in self._op_type_map.values()], []))
-        type_map = self._op_type_map.get(op_name, OrderedDict())
-        type_tree = self._op_type_tree.get(op_name, OrderedDict())
+        type_map = self._op_type_map.get(op_name, {})
+        type_tree = self._op_type_tree.get(op_name, {})
         for t in sorted(known_types, key=lambda t: t.__name__):
             if t in type_map:
                 continue
@@ -2171,6 +2264,7 @@ class TargetRegistry:
         self._op_type_map[op_name] = type_map
         self._op_type_tree[op_name] = type_tree
         self._op_auto_map[op_name] = auto_func
+        self._type_cache = {}  # reset type cache
 
     def _register_builtin_ops(self):
         def _get_iterable_handler(type_obj):
@@ -2254,18 +2348,19 @@ def glom(target, spec, **kwargs):
     default = kwargs.pop('default', None if 'skip_exc' in kwargs else _MISSING)
     skip_exc = kwargs.pop('skip_exc', () if default is _MISSING else GlomError)
     glom_debug = kwargs.pop('glom_debug', GLOM_DEBUG)
-    scope = _DEFAULT_SCOPE.new_child({
+    scope_map = {
         Path: kwargs.pop('path', []),
         Inspect: kwargs.pop('inspector', None),
         MODE: AUTO,
         MIN_MODE: None,
         CHILD_ERRORS: [],
         'globals': ScopeVars({}, {}),
-    })
-    scope[UP] = scope
-    scope[ROOT] = scope
-    scope[T] = target
-    scope.update(kwargs.pop('scope', {}))
+        T: target,
+    }
+    scope = _DEFAULT_SCOPE.new_child(scope_map)
+    # write the map directly, ChainMap's __setitem__/update are Python-level
+    scope_map[UP] = scope_map[ROOT] = scope
+    scope_map.update(kwargs.pop('scope', ()))
     err = None
     if kwargs:
         raise TypeError('unexpected keyword args: %r' % sorted(kwargs.keys()))
@@ -2341,10 +2436,11 @@ def _glom(target, spec, scope):
     pmap[LAST_CHILD_SCOPE] = scope
 
     try:
-        if type(spec) is TType:  # must go first, due to callability
+        spec_type = type(spec)
+        if spec_type is TType:  # must go first, due to callability
             scope[MIN_MODE] = None  # None is tombstone
             return _t_eval(target, spec, scope)
-        elif _has_callable_glomit(spec):
+        elif spec_type is not str and _has_callable_glomit(spec):  # str: common, no glomit
             scope[MIN_MODE] = None
             return spec.glomit(target, scope)
 
@@ -2361,9 +2457,16 @@ def _glom(target, spec, scope):
         raise
 
 
+# exact-type fast path for AUTO, subclasses fall through to isinstance()
+_AUTO_HANDLERS = {dict: _handle_dict, list: _handle_list, tuple: _handle_tuple}
+
+
 def AUTO(target, spec, scope):
     if type(spec) is str:  # shortcut to make deep-get use case faster
         return _t_eval(target, Path.from_text(spec).path_t, scope)
+    handler = _AUTO_HANDLERS.get(type(spec))
+    if handler is not None:
+        return handler(target, spec, scope)
     if isinstance(spec, dict):
         return _handle_dict(target, spec, scope)
     elif isinstance(spec, list):
@@ -99,12 +99,15 @@ class Iter:
                             % (target.__class__.__name__, Path(*scope[Path]), e))
 
         base_path = scope[Path]
+        subspec, sentinel = self.subspec, self.sentinel
+        identity = subspec is T  # the default, no need to glom each item
+        glom_ = scope[glom]
         for i, t in enumerate(iterator):
             scope[Path] = base_path + [i]
-            yld = (t if self.subspec is T else scope[glom](t, self.subspec, scope))
+            yld = t if identity else glom_(t, subspec, scope)
             if yld is SKIP:
                 continue
-            elif yld is self.sentinel or yld is STOP:
+            elif yld is sentinel or yld is STOP:
                 # NB: sentinel defaults to STOP so I was torn whether
                 # to also check for STOP, and landed on the side of
                 # never letting STOP through.
@@ -252,6 +255,8 @@ class Iter:
         >>> print(''.join(out))
         gloMIcus
         """
+        if key is T:  # identity key, skip the per-item glom
+            return self._add_op('unique', (key,), lambda it, scope: unique_iter(it))
         return self._add_op(
             'unique',
             (key,),
@@ -293,6 +298,8 @@ class Iter:
 
         :func:`itertools.takewhile` for more details.
         """
+        if key is T:  # identity key, plain truthiness will do
+            return self._add_op('takewhile', (key,), lambda it, scope: takewhile(bool, it))
         return self._add_op(
             'takewhile',
             (key,),
@@ -314,6 +321,8 @@ class Iter:
 
         """
 
+        if key is T:
+            return self._add_op('dropwhile', (key,), lambda it, scope: dropwhile(bool, it))
         return self._add_op(
             'dropwhile',
             (key,),
@@ -99,6 +99,23 @@ def test_coalesce():
     with pytest.raises(TypeError):
         Coalesce(bad_kwarg=True)
 
+    with pytest.raises(TypeError, match=r"\['a_kwarg', 'b_kwarg'\]"):
+        Coalesce(b_kwarg=True, a_kwarg=True)
+
+
+
+def test_path_not_shared_between_branches():
+    target = {'a': {'x': {'y': 'z'}}}
+
+    spec = {'a': ('a', 'x', 'y'), 'b': Coalesce('nope')}
+    with pytest.raises(CoalesceError) as exc_info:
+        glom(target, spec)
+    assert exc_info.value.path == []
+
+    spec = {'a': T['a']['x']['y'].upper(), 'b': Coalesce('nope')}
+    with pytest.raises(CoalesceError) as exc_info:
+        glom(target, spec)
+    assert exc_info.value.path == []
 
 
 def test_skip():
@@ -401,6 +418,31 @@ def test_inspect():
     assert len(tracker) == 1
 
 
+def test_inspect_recursive_echo(capsys):
+    # literal path segments aren't glommed as args, so they don't echo
+    glom({'a': {'b': 1}}, Inspect('a.b', recursive=True))
+    out = capsys.readouterr().out
+    assert out == ("---\n"
+                   "path:   ['a.b']\n"
+                   "target: {'a': {'b': 1}}\n"
+                   "output: 1\n"
+                   "---\n")
+
+    # literal Call args and kwargs are passed through, only func echoes
+    glom(None, Inspect(Call(max, args=(1, 2)), recursive=True))
+    out = capsys.readouterr().out
+    assert out == ("---\n"
+                   "path:   [Call(max, args=(1, 2), kwargs={})]\n"
+                   "target: None\n"
+                   "---\n"
+                   "path:   [<built-in function max>]\n"
+                   "target: None\n"
+                   "output: <built-in function max>\n"
+                   "---\n"
+                   "output: 2\n"
+                   "---\n")
+
+
 def test_ref():
     assert glom([[[]]], Ref('item', [Ref('item')])) == [[[]]]
     with pytest.raises(Exception):  # check that it recurses downards and dies on int iteration
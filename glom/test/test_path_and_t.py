@@ -1,6 +1,6 @@
 from pytest import raises
 
-from glom import glom, Path, S, T, A, PathAccessError, GlomError, BadSpec, Or, Assign, Delete
+from glom import glom, Path, S, T, A, Val, PathAccessError, GlomError, BadSpec, Or, Assign, Delete
 from glom import core
 
 def test_list_path_access():
@@ -102,6 +102,43 @@ def test_t_picklability():
     s_spec = S.attribute
     assert repr(s_spec) == repr(pickle.loads(pickle.dumps(s_spec)))
 
+    path = Path('a', T.b, 1)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(path, protocol)) == path
+        assert pickle.loads(pickle.dumps(Path(), protocol)) == Path()
+        assert glom(None, pickle.loads(pickle.dumps(Val(0), protocol))) == 0
+
+
+class _TaggedPath(Path):
+    pass
+
+
+def test_path_val_pickle_compat():
+    import pickle
+    import weakref
+
+    # [Path('a', T.b, 1), Val(3)] pickled (protocol 2) before Path and
+    # Val had __slots__, with their state stored as an instance dict
+    old_pickle = (b'\x80\x02]q\x00(cglom.core\nPath\nq\x01)\x81q\x02}q\x03X\x06\x00'
+                  b'\x00\x00path_tq\x04cglom.core\nTType\nq\x05)\x81q\x06(X\x01\x00\x00'
+                  b'\x00Tq\x07X\x01\x00\x00\x00Pq\x08X\x01\x00\x00\x00aq\tX\x01\x00\x00'
+                  b'\x00.q\nX\x01\x00\x00\x00bq\x0bh\x08K\x01tq\x0cbsbcglom.core\nVal\nq'
+                  b'\r)\x81q\x0e}q\x0fX\x05\x00\x00\x00valueq\x10K\x03sbe.')
+    path, val = pickle.loads(old_pickle)
+    assert path == Path('a', T.b, 1)
+    assert glom(None, val) == 3
+
+    assert weakref.ref(path)() is path
+    assert weakref.ref(val)() is val
+
+    tagged = _TaggedPath('a')
+    tagged.tag = 'x'
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        rt_tagged = pickle.loads(pickle.dumps(tagged, protocol))
+        assert type(rt_tagged) is _TaggedPath
+        assert rt_tagged.values() == ('a',)
+        assert rt_tagged.tag == 'x'
+
 
 def test_t_subspec():
     # tests that arg-mode is a min-mode, allowing for
@@ -274,6 +311,21 @@ def test_path_eq():
     assert Path() != object()
 
 
+def test_path_hash():
+    assert hash(Path('a', 'b')) == hash(Path('a', 'b'))
+    cache = {Path('a', 'b'): 1}
+    assert cache[Path('a', 'b')] == 1
+    assert Path('a', 'c') not in cache
+    assert len({Path(), Path(), Path('a')}) == 2
+
+    with raises(TypeError):
+        hash(Path(T.a(x=[])))
+
+    # Path == T, but T hashes by identity, so they don't mix as keys
+    assert Path(T.a) == T.a
+    assert Path(T.a) not in {T.a: 1}
+
+
 def test_path_eq_t():
     assert Path(T.a.b) == T.a.b
     assert Path(T.a.b.c) != T.a.b
@@ -162,6 +162,11 @@ def test_while():
     assert list(out) == [4, 5, 6, 7]
     assert repr(Iter().dropwhile(T.a) == 'Iter().dropwhile(T.a)')
 
+    # default key is the item itself
+    assert list(glom([3, 2, 0, 1], Iter().takewhile())) == [3, 2]
+    assert list(glom([1, 'a', 0, 3], Iter().dropwhile())) == [0, 3]
+    assert repr(Iter().takewhile()) == 'Iter().takewhile(T)'
+
 
 def test_iter_composition():
     int_list = list(range(10))
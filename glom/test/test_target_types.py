@@ -54,7 +54,7 @@ def test_types_bare():
     # test that bare glommers can't glom anything
     with pytest.raises(UnregisteredTarget) as exc_info:
         glommer.glom(object(), {'object_repr': '__class__.__name__'})
-    assert repr(exc_info.value) == "UnregisteredTarget('get', <type 'object'>, OrderedDict(), ('__class__',))"
+    assert repr(exc_info.value) == "UnregisteredTarget('get', <type 'object'>, {}, ('__class__',))"
     assert str(exc_info.value).find(
         "glom() called without registering any types for operation 'get'."
         " see glom.register() or Glommer's constructor for details.") != -1
@@ -270,3 +270,17 @@ def test_reregister_type():
     treg.register(NewType, op=lambda obj: obj.__class__.__name__)
     handler = treg.get_handler('op', obj)
     assert handler(obj) == 'NewType'
+
+
+def test_get_handler_cached_miss():
+    treg = TargetRegistry(register_default_types=False)
+
+    obj = object()
+    assert treg.get_handler('get', obj, raise_exc=False) is False
+
+    # a cached miss should still raise when asked to
+    with pytest.raises(UnregisteredTarget):
+        treg.get_handler('get', obj)
+
+    treg.register(object, get=getattr)
+    assert treg.get_handler('get', obj) is getattr